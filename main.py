@@ -1,62 +1,177 @@
 # main.py
 from fastapi import FastAPI, HTTPException, Request, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-import hashlib, sqlite3, json, os, re
-from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+import hashlib, sqlite3, os, re, functools, threading, time, itertools
+import orjson
+from typing import Optional, List, Dict, Any, Tuple
+from collections import Counter, OrderedDict
 from contextlib import closing
+from pathlib import Path
+
+try:  # optional accelerator for long ASCII strings; Counter is used when it is not installed
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
 
 APP_NAME = "string-analyzer"
 DB_PATH = os.environ.get("DB_PATH", "strings.db")  # configurable
 
-app = FastAPI(title=APP_NAME)
+app = FastAPI(title=APP_NAME, default_response_class=ORJSONResponse)
 
 # ---------- DB helpers ----------
 def init_db():
     conn = sqlite3.connect(DB_PATH)
     cur = conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
     cur.execute("""
     CREATE TABLE IF NOT EXISTS strings (
         id TEXT PRIMARY KEY,
         value TEXT NOT NULL,
-        properties TEXT NOT NULL,
-        created_at TEXT NOT NULL
+        properties BLOB NOT NULL,
+        created_at TEXT NOT NULL,
+        length INTEGER,
+        is_palindrome INTEGER,
+        word_count INTEGER,
+        char_mask_lo INTEGER,
+        char_mask_hi INTEGER
     );
     """)
+    # older databases predate the filter columns; add and backfill them from the stored JSON
+    existing = {row[1] for row in cur.execute("PRAGMA table_info(strings)")}
+    for col in ("length", "is_palindrome", "word_count", "char_mask_lo", "char_mask_hi"):
+        if col not in existing:
+            cur.execute(f"ALTER TABLE strings ADD COLUMN {col} INTEGER")
+    cur.execute("""
+    UPDATE strings SET
+        length = json_extract(properties, '$.length'),
+        is_palindrome = json_extract(properties, '$.is_palindrome'),
+        word_count = json_extract(properties, '$.word_count')
+    WHERE length IS NULL;
+    """)
+    rows = cur.execute("SELECT id, value FROM strings WHERE char_mask_lo IS NULL").fetchall()
+    cur.executemany(
+        "UPDATE strings SET char_mask_lo = ?, char_mask_hi = ? WHERE id = ?",
+        [(*char_masks(set(value)), sid) for sid, value in rows]
+    )
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_len ON strings(length)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_wc ON strings(word_count)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_pal ON strings(is_palindrome, length)")
     conn.commit()
     conn.close()
 
+# per-connection tuning; journal_mode=WAL is persistent and set once in init_db
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+_local = threading.local()
+
 def get_connection():
-    # Each request should get its own connection.
-    # sqlite default isolation might block; we'll use default settings but keep connections short-lived.
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
-    conn.row_factory = sqlite3.Row
+    # One long-lived connection per worker thread; handlers use `with conn:` for transactions.
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        _local.conn = conn
+    return conn
+
+# read-only connections may map a larger window since they never dirty pages
+READ_PRAGMAS = (
+    "PRAGMA query_only=1",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=1073741824",
+)
+
+def get_read_connection():
+    # Per-thread read-only connection for the list/lookup endpoints. In WAL mode readers
+    # do not block the writer, and each statement sees the latest committed data.
+    conn = getattr(_local, "ro_conn", None)
+    if conn is None:
+        uri = Path(DB_PATH).resolve().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in READ_PRAGMAS:
+            conn.execute(pragma)
+        _local.ro_conn = conn
     return conn
 
 # ---------- String analysis ----------
+# pure function; path lookups (GET/DELETE) repeat the same values, so keep a bounded cache
+@functools.lru_cache(maxsize=4096)
 def sha256_hash(value: str) -> str:
+    # hashlib.sha256 is OpenSSL's implementation, which picks SHA-NI at runtime when the CPU has it
     return hashlib.sha256(value.encode("utf-8")).hexdigest()
 
-def is_palindrome(value: str) -> bool:
-    s = re.sub(r"\s+", "", value).lower()
-    return s == s[::-1]
+# ASCII whitespace (same set as the regex \s) for the str.translate fast path
+_ASCII_WS = str.maketrans("", "", "".join(c for c in map(chr, range(128)) if c.isspace()))
+
+def _to_int64(mask: int) -> int:
+    # SQLite integers are signed 64-bit
+    return mask - (1 << 64) if mask >= 1 << 63 else mask
+
+def char_masks(chars) -> Tuple[int, int]:
+    # presence bitmaps for ASCII code points 0-63 and 64-127
+    lo = hi = 0
+    for ch in chars:
+        o = ord(ch)
+        if o < 64:
+            lo |= 1 << o
+        elif o < 128:
+            hi |= 1 << (o - 64)
+    return _to_int64(lo), _to_int64(hi)
+
+# below this length the kernel's call overhead outweighs its per-byte speed
+FREQ_KERNEL_MIN_LEN = 1024
 
-def character_frequency_map(value: str) -> Dict[str, int]:
-    freq = {}
-    for ch in value:
-        freq[ch] = freq.get(ch, 0) + 1
-    return freq
+if njit is not None:
+    @njit(cache=True)
+    def _ascii_freq(buf):
+        counts = np.zeros(128, np.int64)
+        first = np.zeros(128, np.int64)
+        for i in range(buf.shape[0]):
+            b = buf[i]
+            if counts[b] == 0:
+                first[b] = i
+            counts[b] += 1
+        return counts, first
+
+def character_frequency_map(value: str, encoded: Optional[bytes] = None) -> Dict[str, int]:
+    # `encoded` is value's UTF-8 bytes when the caller already has them
+    if njit is not None and len(value) >= FREQ_KERNEL_MIN_LEN and value.isascii():
+        buf = encoded if encoded is not None else value.encode("ascii")
+        counts, first = _ascii_freq(np.frombuffer(buf, np.uint8))
+        present = np.nonzero(counts)[0]
+        # first-occurrence order, same as Counter
+        present = present[np.argsort(first[present])]
+        return {chr(i): int(counts[i]) for i in present}
+    return dict(Counter(value))
 
 def analyze_string(value: str) -> Dict[str, Any]:
     if not isinstance(value, str):
         raise ValueError("value must be a string")
     value_str = value
     length = len(value_str)
-    palindrome = is_palindrome(value_str)
-    unique_chars = len(set(value_str))
-    word_count = 0 if value_str.strip() == "" else len(value_str.split())
-    sha = sha256_hash(value_str)
-    freq_map = character_frequency_map(value_str)
+    # encode once; the bytes feed both the hash and the frequency kernel
+    data = value_str.encode("utf-8")
+    freq_map = character_frequency_map(value_str, data)
+    unique_chars = len(freq_map)
+    words = value_str.split()
+    word_count = len(words)
+    # strip whitespace for the palindrome check: translate is a tight C loop for ASCII
+    # input; otherwise reuse the split instead of scanning for whitespace again
+    stripped = value_str.translate(_ASCII_WS) if value_str.isascii() else "".join(words)
+    stripped = stripped.lower()
+    palindrome = stripped == stripped[::-1]
+    # hashed directly rather than through sha256_hash so request bodies are not kept in its cache
+    sha = hashlib.sha256(data).hexdigest()
     props = {
         "length": length,
         "is_palindrome": palindrome,
@@ -67,16 +182,65 @@ def analyze_string(value: str) -> Dict[str, Any]:
     }
     return props
 
+# (second, "YYYY-MM-DDTHH:MM:SS") for the current second; swapped as one tuple so threads never see a torn pair
+_ts_cache = (None, "")
+
+def now_iso() -> str:
+    # ISO-8601 UTC like datetime.now(timezone.utc).isoformat(), except that microseconds are
+    # always written (.000000 where isoformat() would drop them). The date/time part is
+    # formatted once per second and only the microseconds are filled in per call.
+    global _ts_cache
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{ns // 1000:06d}+00:00"
+
 # ---------- Models ----------
 class CreateStringReq(BaseModel):
     value: str
 
+class CreateStringsBulkReq(BaseModel):
+    values: List[str]
+
 # ---------- Startup ----------
+# ids present in the table, so new strings can be inserted without a SELECT first.
+# Only a hint: it is updated after commit, so it can briefly lag the table. A hit is
+# confirmed with a query before rejecting, and a miss is caught by the PK constraint.
+# Per process: the Procfile runs a single worker.
+KNOWN_IDS = set()
+
 @app.on_event("startup")
 def startup_event():
     init_db()
+    if njit is not None:
+        # compile (or load from the on-disk cache) now rather than inside the first large POST;
+        # frombuffer gives the same read-only array type that character_frequency_map passes
+        _ascii_freq(np.frombuffer(b"\0", np.uint8))
+    conn = get_read_connection()
+    KNOWN_IDS.update(row["id"] for row in conn.execute("SELECT id FROM strings"))
 
 # ---------- Endpoints ----------
+INSERT_COLUMNS = (
+    "(id, value, properties, created_at, length, is_palindrome, word_count, char_mask_lo, char_mask_hi) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+BULK_CHUNK = 500  # ids per IN (...) existence probe
+
+def insert_row(payload: Dict[str, Any]) -> tuple:
+    props = payload["properties"]
+    mask_lo, mask_hi = char_masks(props["character_frequency_map"])
+    return (payload["id"], payload["value"], orjson.dumps(props), payload["created_at"],
+            props["length"], props["is_palindrome"], props["word_count"], mask_lo, mask_hi)
+
+def existing_ids(conn: sqlite3.Connection, ids: List[str]) -> set:
+    found = set()
+    for i in range(0, len(ids), BULK_CHUNK):
+        chunk = ids[i:i + BULK_CHUNK]
+        cur = conn.execute(f"SELECT id FROM strings WHERE id IN ({','.join('?' * len(chunk))})", chunk)
+        found.update(row["id"] for row in cur)
+    return found
 
 @app.post("/strings", status_code=201)
 def create_string(req: CreateStringReq):
@@ -87,7 +251,7 @@ def create_string(req: CreateStringReq):
         raise HTTPException(status_code=422, detail="'value' must be a string")
     props = analyze_string(value)
     sid = props["sha256_hash"]
-    created_at = datetime.now(timezone.utc).isoformat()
+    created_at = now_iso()
     payload = {
         "id": sid,
         "value": value,
@@ -95,62 +259,158 @@ def create_string(req: CreateStringReq):
         "created_at": created_at
     }
     conn = get_connection()
+    if sid in KNOWN_IDS and conn.execute("SELECT 1 FROM strings WHERE id = ?", (sid,)).fetchone():
+        raise HTTPException(status_code=409, detail="String already exists")
     try:
         with conn:
-            cur = conn.cursor()
-            # check if exists by id
-            cur.execute("SELECT 1 FROM strings WHERE id = ?", (sid,))
-            if cur.fetchone():
-                raise HTTPException(status_code=409, detail="String already exists")
-            cur.execute(
-                "INSERT INTO strings (id, value, properties, created_at) VALUES (?, ?, ?, ?)",
-                (sid, value, json.dumps(props), created_at)
-            )
-    finally:
-        conn.close()
-    return payload
+            conn.execute("INSERT INTO strings " + INSERT_COLUMNS, insert_row(payload))
+    except sqlite3.IntegrityError:
+        KNOWN_IDS.add(sid)
+        raise HTTPException(status_code=409, detail="String already exists")
+    KNOWN_IDS.add(sid)
+    bump_data_version()
+    return ORJSONResponse(payload, status_code=201)
+
+@app.post("/strings/bulk", status_code=201)
+def create_strings_bulk(req: CreateStringsBulkReq):
+    created_at = now_iso()
+    payloads = {}
+    for value in req.values:
+        props = analyze_string(value)
+        # duplicates within the batch collapse onto the first occurrence
+        payloads.setdefault(props["sha256_hash"], {
+            "id": props["sha256_hash"],
+            "value": value,
+            "properties": props,
+            "created_at": created_at
+        })
+    conn = get_connection()
+    with conn:
+        # hold the write lock so the table cannot change between the checks and the insert
+        conn.execute("BEGIN IMMEDIATE")
+        # KNOWN_IDS is a hint: confirm its hits, which can be stale after a racing delete
+        existing = existing_ids(conn, [sid for sid in payloads if sid in KNOWN_IDS])
+        created = [p for sid, p in payloads.items() if sid not in existing]
+        conn.execute("SAVEPOINT bulk_insert")
+        before = conn.total_changes
+        # one prepared statement for the whole batch, committed in a single transaction
+        conn.executemany("INSERT OR IGNORE INTO strings " + INSERT_COLUMNS, map(insert_row, created))
+        if conn.total_changes - before != len(created):
+            # some id was stored but not yet in KNOWN_IDS; redo the batch against the table itself
+            conn.execute("ROLLBACK TO bulk_insert")
+            existing = existing_ids(conn, list(payloads))
+            created = [p for sid, p in payloads.items() if sid not in existing]
+            conn.executemany("INSERT INTO strings " + INSERT_COLUMNS, map(insert_row, created))
+    KNOWN_IDS.update(payloads)
+    bump_data_version()
+    return ORJSONResponse(
+        {"data": created, "count": len(created), "skipped": len(req.values) - len(created)},
+        status_code=201
+    )
 
 @app.get("/strings/{string_value}")
 def get_string(string_value: str):
     sid = sha256_hash(string_value)
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute("SELECT id, value, properties, created_at FROM strings WHERE id = ?", (sid,))
-        row = cur.fetchone()
-        if not row:
-            raise HTTPException(status_code=404, detail="String not found")
-        props = json.loads(row["properties"])
-        return {
+    conn = get_read_connection()
+    cur = conn.cursor()
+    cur.execute("SELECT id, value, properties, created_at FROM strings WHERE id = ?", (sid,))
+    row = cur.fetchone()
+    if not row:
+        raise HTTPException(status_code=404, detail="String not found")
+    return ORJSONResponse({
+        "id": row["id"],
+        "value": row["value"],
+        # stored JSON is spliced into the response as-is, without a decode/encode round-trip
+        "properties": orjson.Fragment(row["properties"]),
+        "created_at": row["created_at"]
+    })
+
+# filter name -> SQL predicate over the promoted columns
+FILTER_SQL = {
+    "is_palindrome": "is_palindrome = ?",
+    "min_length": "length >= ?",
+    "max_length": "length <= ?",
+    "word_count": "word_count = ?",
+    "char_mask_lo": "(char_mask_lo & ?) != 0",
+    "char_mask_hi": "(char_mask_hi & ?) != 0",
+    # non-ASCII characters have no mask bit and fall back to scanning the value
+    "contains_character": "instr(value, ?) > 0",
+}
+
+def sql_filters(filters: Dict[str, Any]) -> Dict[str, Any]:
+    # rewrite an ASCII contains_character into a test on the presence bitmaps
+    ch = filters.get("contains_character")
+    if ch is None or ord(ch) >= 128:
+        return filters
+    out = {k: v for k, v in filters.items() if k != "contains_character"}
+    out["char_mask_lo" if ord(ch) < 64 else "char_mask_hi"] = _to_int64(1 << (ord(ch) % 64))
+    return out
+
+def fetch_filtered(conn: sqlite3.Connection, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+    filters = sql_filters(filters)
+    clauses = [FILTER_SQL[k] for k in FILTER_SQL if k in filters]
+    params = [filters[k] for k in FILTER_SQL if k in filters]
+    sql = "SELECT id, value, properties, created_at FROM strings"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY rowid"
+    cur = conn.cursor()
+    cur.execute(sql, params)
+    return [
+        {
             "id": row["id"],
             "value": row["value"],
-            "properties": props,
+            "properties": orjson.Fragment(row["properties"]),
             "created_at": row["created_at"]
         }
-    finally:
-        conn.close()
-
-def apply_filters_row(props: Dict[str, Any], filters: Dict[str, Any]) -> bool:
-    # props are the stored properties dict
-    if "is_palindrome" in filters:
-        if props.get("is_palindrome") != filters["is_palindrome"]:
-            return False
-    if "min_length" in filters:
-        if props.get("length", 0) < filters["min_length"]:
-            return False
-    if "max_length" in filters:
-        if props.get("length", 0) > filters["max_length"]:
-            return False
-    if "word_count" in filters:
-        if props.get("word_count") != filters["word_count"]:
-            return False
-    if "contains_character" in filters:
-        ch = filters["contains_character"]
-        if not isinstance(ch, str) or len(ch) != 1:
-            return False
-        if ch not in props.get("character_frequency_map", {}):
-            return False
-    return True
+        for row in cur.fetchall()
+    ]
+
+# Bumped after every committed insert/delete. The bump also empties the results cache; the
+# version stays in the key so a reader that raced a write stores its entry under a dead key.
+# Like KNOWN_IDS this is per process.
+_versions = itertools.count(1)
+_data_version = next(_versions)
+
+# Serialized list results, LRU-ordered, with the total size of all entries capped.
+# Result sets larger than the cap are served but never cached.
+RESULTS_CACHE_MAX_BYTES = 16 * 1024 * 1024
+_results_cache = OrderedDict()
+_results_cache_bytes = 0
+_results_lock = threading.Lock()
+
+def clear_results_cache():
+    global _results_cache_bytes
+    with _results_lock:
+        _results_cache.clear()
+        _results_cache_bytes = 0
+
+def bump_data_version():
+    global _data_version
+    _data_version = next(_versions)
+    clear_results_cache()
+
+def cached_results(filter_items: Tuple[Tuple[str, Any], ...], version: int) -> Tuple[bytes, int]:
+    # serialized "data" array and its length for one filter set at one data version
+    global _results_cache_bytes
+    key = (filter_items, version)
+    with _results_lock:
+        entry = _results_cache.get(key)
+        if entry is not None:
+            _results_cache.move_to_end(key)
+            return entry
+    results = fetch_filtered(get_read_connection(), dict(filter_items))
+    entry = (orjson.dumps(results), len(results))
+    size = len(entry[0])
+    if size <= RESULTS_CACHE_MAX_BYTES:
+        with _results_lock:
+            if key not in _results_cache:
+                _results_cache[key] = entry
+                _results_cache_bytes += size
+                while _results_cache_bytes > RESULTS_CACHE_MAX_BYTES:
+                    _, (old_data, _) = _results_cache.popitem(last=False)
+                    _results_cache_bytes -= len(old_data)
+    return entry
 
 @app.get("/strings")
 def list_strings(
@@ -172,82 +432,67 @@ def list_strings(
     if contains_character is not None:
         filters["contains_character"] = contains_character
 
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute("SELECT id, value, properties, created_at FROM strings")
-        results = []
-        for row in cur.fetchall():
-            props = json.loads(row["properties"])
-            if apply_filters_row(props, filters):
-                results.append({
-                    "id": row["id"],
-                    "value": row["value"],
-                    "properties": props,
-                    "created_at": row["created_at"]
-                })
-        return {"data": results, "count": len(results), "filters_applied": filters}
-    finally:
-        conn.close()
+    data, count = cached_results(tuple(sorted(filters.items())), _data_version)
+    return ORJSONResponse({"data": orjson.Fragment(data), "count": count, "filters_applied": filters})
 
-@app.get("/strings/filter-by-natural-language")
-def filter_by_nl(query: str = Query(...)):
-    # A simple heuristic parser for the example phrases.
-    q = query.lower().strip()
+# All natural-language needles in one alternation so the query is scanned once.
+# "strings longer than" is listed before "longer than" so it wins at the same position.
+_NL_TOKENS = re.compile(
+    r"(?P<single_word>single word|one word)"
+    r"|(?P<palindrome>palindrom)"
+    r"|strings longer than (?P<longer_str>\d+)"
+    r"|longer than (?P<longer>\d+)"
+    r"|contain(?:ing|s)? the letter (?=(?P<letter>[a-z]))"
+)
+
+@functools.lru_cache(maxsize=1024)
+def parse_query(q: str) -> Dict[str, Any]:
+    # A simple heuristic parser for the example phrases. Callers must not mutate the result.
     parsed = {}
+    found = {}
+    for m in _NL_TOKENS.finditer(q):
+        # keep the first occurrence of each needle
+        found.setdefault(m.lastgroup, m.group(m.lastgroup))
     # "single word palindromic"
-    if "single word" in q or "one word" in q:
+    if "single_word" in found:
         parsed["word_count"] = 1
-    if "palindrom" in q:
+    if "palindrome" in found:
         parsed["is_palindrome"] = True
-    m = re.search(r"longer than (\d+)", q)
-    if m:
-        parsed["min_length"] = int(m.group(1)) + 0  # user expects > N; task says longer than 10 -> min_length=11; user phrase should be explicit
-    m2 = re.search(r"strings longer than (\d+)", q)
-    if m2:
-        parsed["min_length"] = int(m2.group(1)) + 1
-    m3 = re.search(r"contain(?:ing|s)? the letter ([a-z])", q)
-    if m3:
-        parsed["contains_character"] = m3.group(1)
+    if "longer_str" in found:
+        parsed["min_length"] = int(found["longer_str"]) + 1
+    elif "longer" in found:
+        parsed["min_length"] = int(found["longer"]) + 0  # user expects > N; task says longer than 10 -> min_length=11; user phrase should be explicit
+    if "letter" in found:
+        parsed["contains_character"] = found["letter"]
+    return parsed
+
+@app.get("/strings/filter-by-natural-language")
+def filter_by_nl(query: str = Query(...)):
+    q = query.lower().strip()
+    parsed = dict(parse_query(q))
     # if no parsed filters -> error
     if not parsed:
         raise HTTPException(status_code=400, detail="Unable to parse natural language query")
     # now use the generic list_strings logic to filter
-    conn = get_connection()
-    try:
-        cur = conn.cursor()
-        cur.execute("SELECT id, value, properties, created_at FROM strings")
-        results = []
-        for row in cur.fetchall():
-            props = json.loads(row["properties"])
-            if apply_filters_row(props, parsed):
-                results.append({
-                    "id": row["id"],
-                    "value": row["value"],
-                    "properties": props,
-                    "created_at": row["created_at"]
-                })
-        return {
-            "data": results,
-            "count": len(results),
-            "interpreted_query": {
-                "original": query,
-                "parsed_filters": parsed
-            }
+    data, count = cached_results(tuple(sorted(parsed.items())), _data_version)
+    return ORJSONResponse({
+        "data": orjson.Fragment(data),
+        "count": count,
+        "interpreted_query": {
+            "original": query,
+            "parsed_filters": parsed
         }
-    finally:
-        conn.close()
+    })
 
 @app.delete("/strings/{string_value}", status_code=204)
 def delete_string(string_value: str):
     sid = sha256_hash(string_value)
     conn = get_connection()
-    try:
-        with conn:
-            cur = conn.cursor()
-            cur.execute("DELETE FROM strings WHERE id = ?", (sid,))
-            if cur.rowcount == 0:
-                raise HTTPException(status_code=404, detail="String not found")
-    finally:
-        conn.close()
+    with conn:
+        cur = conn.cursor()
+        cur.execute("DELETE FROM strings WHERE id = ?", (sid,))
+        if cur.rowcount == 0:
+            raise HTTPException(status_code=404, detail="String not found")
+    KNOWN_IDS.discard(sid)
+    bump_data_version()
     return None